@@ -2,10 +2,9 @@
 from __future__ import annotations
 import asyncio
 import logging
-import time
 from typing import Optional
 
-from shared.clock_sync import ClockSyncState, SyncSample, compute_drift_correction
+from shared.clock_sync import ClockSyncState, SyncSample, compute_drift_correction, now_ms
 from shared.protocol import make_envelope, MSG_SYNC_REPLY, MSG_DRIFT
 
 logger = logging.getLogger("cuemesh.client.clock")
@@ -45,8 +44,8 @@ class ClockClient:
     async def handle_sync(self, payload: dict) -> None:
         """Called when SYNC message received from controller."""
         t1 = payload.get("t1_utc_ms", 0)
-        t2 = int(time.time() * 1000)
-        t3 = int(time.time() * 1000)
+        t2 = now_ms()
+        t3 = now_ms()
         await self.send(MSG_SYNC_REPLY, {
             "t1_utc_ms": t1,
             "t2_client_recv_utc_ms": t2,
@@ -14,7 +14,7 @@ import websockets
 from websockets.client import WebSocketClientProtocol
 
 from shared.protocol import (
-    make_envelope, parse_envelope,
+    make_envelope, parse_envelope, parse_envelope_binary, HAS_MSGPACK,
     MSG_HELLO, MSG_AUTH, MSG_STATUS, MSG_HEARTBEAT,
     MSG_HELLO_ACK, MSG_ACCEPT, MSG_REJECT,
     MSG_LOAD_CUE, MSG_PLAY_AT, MSG_PAUSE, MSG_STOP,
@@ -114,7 +114,7 @@ class ClientConnection:
             "client_id": self.client_id,
             "hostname": self.hostname,
             "platform": self.platform_str,
-            "capabilities": {"mpv": True},
+            "capabilities": {"mpv": True, "msgpack": HAS_MSGPACK},
             "token": self.token,
         })
 
@@ -135,8 +135,12 @@ class ClientConnection:
             "fullscreen": True,
         })
 
-    async def _handle_message(self, raw: str) -> None:
-        msg_type, ts, payload = parse_envelope(raw)
+    async def _handle_message(self, raw: str | bytes) -> None:
+        # Binary frames are msgpack envelopes, sent only if HELLO advertised "msgpack"
+        if isinstance(raw, bytes):
+            msg_type, ts, payload = parse_envelope_binary(raw)
+        else:
+            msg_type, ts, payload = parse_envelope(raw)
         logger.debug("Recv: %s", msg_type)
 
         if msg_type == MSG_HELLO_ACK:
@@ -113,11 +113,11 @@ class AppState:
     def jump_to_cue(self, cue_id: str) -> Optional[Cue]:
         if self.show is None:
             return None
-        for i, cue in enumerate(self.show.cues):
-            if cue.id == cue_id:
-                self.run.current_cue_index = i
-                return cue
-        return None
+        idx = self.show.index_of(cue_id)
+        if idx is None:
+            return None
+        self.run.current_cue_index = idx
+        return self.show.cues[idx]
 
     def _load_config(self) -> None:
         """Load controller configuration from disk."""
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Optional
 
 from shared.hashing import sha256_file, build_media_manifest
+from shared.hash_cache import load_cache, save_cache
 
 logger = logging.getLogger("cuemesh.controller.preflight")
 
@@ -50,7 +51,14 @@ class PreflightCoordinator:
         self._controller_manifest: dict[str, Optional[str]] = {}
 
     def build_controller_manifest(self) -> dict[str, Optional[str]]:
-        self._controller_manifest = build_media_manifest(self.media_root, self.cue_files)
+        cache = load_cache()
+        before = dict(cache)
+        # Pruned to this show's media so the cache file can't grow without bound
+        self._controller_manifest = build_media_manifest(
+            self.media_root, self.cue_files, cache, prune=True
+        )
+        if cache != before:
+            save_cache(cache)
         return self._controller_manifest
 
     async def run(self) -> list[ClientPreflightResult]:
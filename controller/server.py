@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import statistics
 import time
 import uuid
 from typing import Any, Optional, Callable
@@ -17,9 +18,9 @@ from shared.protocol import (
     MSG_READY_CHECK, MSG_PLAY_AT, MSG_PAUSE, MSG_STOP,
     MSG_SEEK_TO, MSG_SET_RATE, MSG_SET_VOLUME, MSG_BLACKOUT,
     MSG_SHOW_TESTSCREEN, MSG_REQUEST_STATUS, MSG_SYNC,
-    STATE_IDLE,
+    STATE_IDLE, STATE_PLAYING,
 )
-from shared.clock_sync import ClockSyncState, SyncSample
+from shared.clock_sync import ClockSyncState, SyncSample, now_ms
 
 logger = logging.getLogger("cuemesh.controller.server")
 
@@ -79,6 +80,9 @@ class ControllerServer:
         self._trusted: dict[str, str] = {}  # client_id -> token
         self._ws_server = None
         self._running = False
+        # Authoritative playhead as (position_ms, set_at, playing), advanced locally
+        # while playing. Replaced as a whole so the Qt thread never reads a torn update.
+        self._playhead: tuple[int, float, bool] = (0, time.time(), False)
 
         # Callbacks (set by UI)
         self.on_client_hello: Optional[Callable] = None
@@ -91,6 +95,28 @@ class ControllerServer:
     def clients(self) -> dict[str, ClientSession]:
         return self._clients
 
+    @property
+    def playhead_ms(self) -> int:
+        """Current show position, extrapolated since the last client status."""
+        position_ms, at, playing = self._playhead
+        if not playing:
+            return position_ms
+        # at may lie in the future (PLAY_AT lead time); hold until then
+        return position_ms + max(0, int((time.time() - at) * 1000))
+
+    def _set_playhead(self, position_ms: int, playing: bool, at: Optional[float] = None) -> None:
+        self._playhead = (position_ms, time.time() if at is None else at, playing)
+
+    def _resync_playhead(self) -> None:
+        """Snap the playhead to the median position reported by accepted clients."""
+        accepted = [s for s in self._clients.values() if s.is_accepted]
+        if not accepted:
+            # Nobody left to report; hold the position instead of running on forever
+            self._set_playhead(self.playhead_ms, False)
+            return
+        position_ms = int(statistics.median(s.position_ms for s in accepted))
+        self._set_playhead(position_ms, any(s.state == STATE_PLAYING for s in accepted))
+
     def load_trusted(self, trusted: dict[str, str]) -> None:
         """Load persisted trusted client tokens."""
         self._trusted = dict(trusted)
@@ -137,6 +163,7 @@ class ControllerServer:
             if session:
                 del self._clients[session.client_id]
                 logger.info("Client disconnected: %s", session.client_id)
+                self._resync_playhead()
                 if self.on_client_disconnected:
                     self.on_client_disconnected(session)
 
@@ -183,6 +210,8 @@ class ControllerServer:
         session.volume = payload.get("volume", 100)
         session.last_error = payload.get("last_error")
         session.last_heartbeat = time.time()
+        if session.is_accepted:
+            self._resync_playhead()
         if self.on_client_status:
             self.on_client_status(session)
 
@@ -196,7 +225,7 @@ class ControllerServer:
             self.on_client_log(session, payload)
 
     async def _on_sync_reply(self, session: ClientSession, ts: int, payload: dict) -> None:
-        t4 = int(time.time() * 1000)
+        t4 = now_ms()
         t1 = payload.get("t1_utc_ms", 0)
         t2 = payload.get("t2_client_recv_utc_ms", 0)
         t3 = payload.get("t3_client_send_utc_ms", 0)
@@ -207,7 +236,7 @@ class ControllerServer:
         """Periodically send SYNC to all accepted clients."""
         while self._running:
             await asyncio.sleep(5.0)
-            t1 = int(time.time() * 1000)
+            t1 = now_ms()
             for session in list(self._clients.values()):
                 if session.is_accepted:
                     await session.send(MSG_SYNC, {"t1_utc_ms": t1})
@@ -262,8 +291,9 @@ class ControllerServer:
             payload["fullscreen"] = self._show_settings.fullscreen
         await self.broadcast_accepted(MSG_LOAD_CUE, payload)
 
-    async def send_play_at(self, cue_id: str, start_lead_ms: int = 250) -> None:
+    async def send_play_at(self, cue_id: str, start_lead_ms: int = 250, start_time_ms: int = 0) -> None:
         master_start = int(time.time() * 1000) + start_lead_ms
+        self._set_playhead(start_time_ms, True, at=master_start / 1000)
         await self.broadcast_accepted(MSG_PLAY_AT, {
             "cue_id": cue_id,
             "master_start_utc_ms": master_start,
@@ -271,9 +301,11 @@ class ControllerServer:
         return master_start
 
     async def send_pause(self) -> None:
+        self._set_playhead(self.playhead_ms, False)
         await self.broadcast_accepted(MSG_PAUSE, {})
 
     async def send_stop(self) -> None:
+        self._set_playhead(0, False)
         await self.broadcast_accepted(MSG_STOP, {})
 
     async def send_blackout(self, on: bool) -> None:
@@ -283,6 +315,7 @@ class ControllerServer:
         await self.broadcast_accepted(MSG_SHOW_TESTSCREEN, {"on": on})
 
     async def send_seek(self, position_ms: int) -> None:
+        self._set_playhead(position_ms, self._playhead[2])
         await self.broadcast_accepted(MSG_SEEK_TO, {"position_ms": position_ms})
 
     async def send_set_rate(self, rate: float) -> None:
@@ -22,6 +22,9 @@ from controller.ui.diagnostics import DiagnosticsWidget
 
 logger = logging.getLogger("cuemesh.controller.ui")
 
+# tab label -> panel method that _tick calls to refresh live client state
+_LIVE_REFRESH = {"Clients": "refresh_clients", "Run Show": "refresh_status"}
+
 
 class MainWindow(QMainWindow):
     def __init__(self, state: AppState, server, log_aggregator, loop: asyncio.AbstractEventLoop):
@@ -38,16 +41,18 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         self.setCentralWidget(self.tabs)
 
-        # Panels
-        self.show_editor = ShowEditorWidget(state, self)
-        self.run_mode = RunModeWidget(state, server, loop, self)
-        self.client_manager = ClientManagerWidget(state, server, loop, self)
-        self.diagnostics = DiagnosticsWidget(state, server, log_aggregator, loop, self)
-
-        self.tabs.addTab(self.show_editor, "Show Editor")
-        self.tabs.addTab(self.run_mode, "Run Show")
-        self.tabs.addTab(self.client_manager, "Clients")
-        self.tabs.addTab(self.diagnostics, "Diagnostics")
+        # Panels are built the first time their tab is shown
+        self._tab_factories = {
+            "Show Editor": lambda: ShowEditorWidget(state, self),
+            "Run Show": lambda: RunModeWidget(state, server, loop, self),
+            "Clients": lambda: ClientManagerWidget(state, server, loop, self),
+            "Diagnostics": lambda: DiagnosticsWidget(state, server, log_aggregator, loop, self),
+        }
+        self._tab_instances: dict[str, QWidget] = {}
+        for label in self._tab_factories:
+            self.tabs.addTab(QWidget(), label)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        self._on_tab_changed(self.tabs.currentIndex())
 
         # Status bar
         self.status = QStatusBar()
@@ -114,10 +119,33 @@ class MainWindow(QMainWindow):
         title = self.state.show.title if self.state.show else "CueMesh Controller"
         self.setWindowTitle(f"CueMesh Controller — {title}")
         self.status.showMessage(f"Loaded: {self.state.show_path}")
-        self.show_editor.refresh()
-        self.run_mode.refresh()
+        for label in ("Show Editor", "Run Show"):
+            panel = self._tab_instances.get(label)
+            if panel is not None:
+                panel.refresh()
         self._update_recent_menu()
 
+    def _on_tab_changed(self, index: int) -> None:
+        """Swap a placeholder tab for its real panel on first show."""
+        label = self.tabs.tabText(index)
+        if index < 0 or label in self._tab_instances:
+            return
+        panel = self._tab_factories[label]()
+        self._tab_instances[label] = panel
+        placeholder = self.tabs.widget(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, panel, label)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        if self.state.show is not None and hasattr(panel, "refresh"):
+            panel.refresh()
+        # Fill live status now rather than on the next 1 Hz tick
+        live = _LIVE_REFRESH.get(label)
+        if live is not None:
+            getattr(panel, live)()
+
     def _update_recent_menu(self) -> None:
         """Update the Open Recent submenu with recent shows."""
         self.recent_menu.clear()
@@ -199,5 +227,7 @@ class MainWindow(QMainWindow):
                 QMessageBox.critical(self, "Error", f"Failed to save:\n{e}")
 
     def _tick(self) -> None:
-        self.client_manager.refresh_clients()
-        self.run_mode.refresh_status()
+        for label, live in _LIVE_REFRESH.items():
+            panel = self._tab_instances.get(label)
+            if panel is not None:
+                getattr(panel, live)()
@@ -1,10 +1,10 @@
-"""CueMesh Run Mode panel — GO, Next/Prev, Blackout, Jog."""
+"""CueMesh Run Mode panel — GO, Prev, Pause/Stop, Jump, Timeline."""
 from __future__ import annotations
 import asyncio
 import logging
 from typing import Optional
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QAbstractListModel, QModelIndex, Signal, Slot
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
@@ -17,14 +17,60 @@ from shared.protocol import MSG_PLAY_AT, MSG_PAUSE, MSG_STOP, MSG_BLACKOUT
 
 logger = logging.getLogger("cuemesh.controller.ui.run")
 
+# Slow-moving part of a client status row, and the per-tick heartbeat age suffix
+_STATUS_PREFIX_FMT = "%s: %s | pos:%dms | drift:%.0fms | "
+_STATUS_AGE_FMT = "hb:%.0fs ago"
+
+
+def _log_submit_error(fut) -> None:
+    if not fut.cancelled() and fut.exception() is not None:
+        logger.error("Server command failed", exc_info=fut.exception())
+
+
+class CueListModel(QAbstractListModel):
+    """Read-only cue list for the jump selector; reset in one pass on refresh."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cues: list = []
+
+    def set_cues(self, cues: list) -> None:
+        self.beginResetModel()
+        self._cues = list(cues)
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._cues)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._cues):
+            return None
+        cue = self._cues[index.row()]
+        if role == Qt.DisplayRole:
+            return f"[{cue.id}] {cue.name}"
+        if role == Qt.UserRole:
+            return cue.id
+        return None
+
 
 class RunModeWidget(QWidget):
+    # (client_id, status_text, is_stale) rows, built on the asyncio thread
+    _status_ready = Signal(list)
+
     def __init__(self, state: AppState, server, loop: asyncio.AbstractEventLoop, parent=None):
         super().__init__(parent)
         self.state = state
         self.server = server
         self.loop = loop
+        self._cue_model = CueListModel(self)
+        self._cue_model_key: Optional[tuple] = None
+        self._status_future = None
+        self._status_prefix: dict[str, tuple[tuple, str]] = {}  # asyncio thread only
+        self._status_items: dict[str, QListWidgetItem] = {}
+        self._last_cue_key: Optional[tuple] = None
+        self._rcts = asyncio.run_coroutine_threadsafe
         self._setup_ui()
+        self._status_ready.connect(self._apply_status_payload, Qt.QueuedConnection)
 
     def _setup_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -71,6 +117,7 @@ class RunModeWidget(QWidget):
         # Jump to cue
         jump_row = QHBoxLayout()
         self.cue_selector = QComboBox()
+        self.cue_selector.setModel(self._cue_model)
         self.cue_selector.setMinimumWidth(300)
         self.btn_jump = QPushButton("Jump to Cue")
         self.btn_jump.clicked.connect(self._on_jump)
@@ -115,39 +162,89 @@ class RunModeWidget(QWidget):
 
     def refresh(self) -> None:
         """Refresh cue list after show load."""
-        self.cue_selector.clear()
+        cues = self.state.show.cues if self.state.show else []
         if self.state.show:
             # Update server with show settings
             self.server.set_show_settings(self.state.show.settings)
-            for cue in self.state.show.cues:
-                self.cue_selector.addItem(f"[{cue.id}] {cue.name}", cue.id)
-        self._update_cue_labels()
+        key = tuple((c.id, c.name) for c in cues)
+        if key != self._cue_model_key:
+            self._cue_model_key = key
+            self._cue_model.set_cues(cues)
+        self._update_cue_labels(force=True)
 
     def refresh_status(self) -> None:
         """Called periodically to update client status display."""
-        self.status_list.clear()
-        max_position_ms = 0
-        for cid, session in self.server.clients.items():
-            if session.is_accepted:
-                age = session.heartbeat_age
-                age_str = f"{age:.0f}s ago"
-                drift_str = f"drift:{session.drift_ms:.0f}ms"
-                item_text = f"{session.name}: {session.state} | pos:{session.position_ms}ms | {drift_str} | hb:{age_str}"
-                item = QListWidgetItem(item_text)
-                if age > 10:
-                    item.setForeground(Qt.red)
-                self.status_list.addItem(item)
-                max_position_ms = max(max_position_ms, session.position_ms)
-        
-        # Update timeline
+        # Status rows are formatted on the asyncio thread, where the session data lives
+        if self._status_future is None or self._status_future.done():
+            self._status_future = self._submit(self._build_status_payload())
+            self._status_future.add_done_callback(self._on_status_payload)
+
+        # Update timeline from the server's playhead
         if not self._timeline_dragging:
-            self._update_timeline_position(max_position_ms)
+            self._update_timeline_position(self.server.playhead_ms)
         
         self._update_cue_labels()
 
-    def _update_cue_labels(self) -> None:
+    async def _build_status_payload(self) -> list[tuple[str, str, bool]]:
+        prefix_cache = self._status_prefix
+        age_fmt = _STATUS_AGE_FMT
+        rows = []
+        for cid, s in list(self.server.clients.items()):
+            if not s.is_accepted:
+                continue
+            fields = (s.name, s.state, s.position_ms, s.drift_ms)
+            cached = prefix_cache.get(cid)
+            if cached is None or cached[0] != fields:
+                cached = prefix_cache[cid] = (fields, _STATUS_PREFIX_FMT % fields)
+            age = s.heartbeat_age
+            rows.append((cid, cached[1] + age_fmt % age, age > 10))
+        if len(prefix_cache) > len(rows):
+            live = {row[0] for row in rows}
+            for cid in [c for c in prefix_cache if c not in live]:
+                del prefix_cache[cid]
+        return rows
+
+    def _on_status_payload(self, fut) -> None:
+        if fut.cancelled() or fut.exception() is not None:
+            return
+        # Emitted from the asyncio thread; queued onto the Qt thread
+        self._status_ready.emit(fut.result())
+
+    @Slot(list)
+    def _apply_status_payload(self, rows: list) -> None:
+        """Update client rows in place; only changed text/colour is touched."""
+        items = self._status_items
+        live = {row[0] for row in rows}
+        for cid in [c for c in items if c not in live]:
+            self.status_list.takeItem(self.status_list.row(items.pop(cid)))
+        for cid, text, stale in rows:
+            item = items.get(cid)
+            if item is None:
+                item = items[cid] = QListWidgetItem(text)
+                self.status_list.addItem(item)
+            elif item.text() != text:
+                item.setText(text)
+            if stale != (item.data(Qt.UserRole) or False):
+                item.setData(Qt.UserRole, stale)
+                item.setForeground(Qt.red if stale else self.status_list.palette().text())
+
+    def _submit(self, coro):
+        """Schedule a coroutine on the server loop, logging any failure."""
+        fut = self._rcts(coro, self.loop)
+        fut.add_done_callback(_log_submit_error)
+        return fut
+
+    def _update_cue_labels(self, force: bool = False) -> None:
         cur = self.state.current_cue()
         nxt = self.state.next_cue()
+        # Includes the displayed fields so Show Editor edits show up on the next tick
+        key = (
+            (cur.id, cur.name, cur.start_time_ms, cur.end_time_ms) if cur else None,
+            (nxt.id, nxt.name) if nxt else None,
+        )
+        if key == self._last_cue_key and not force:
+            return
+        self._last_cue_key = key
         self.lbl_current.setText(f"CURRENT: {cur.name if cur else '—'}")
         self.lbl_next.setText(f"NEXT: {nxt.name if nxt else '—'}")
         
@@ -176,38 +273,36 @@ class RunModeWidget(QWidget):
         if cue is None:
             return
         lead_ms = self.state.show.sync.start_lead_ms
-        asyncio.run_coroutine_threadsafe(
-            self._do_go(cue, lead_ms), self.loop
-        )
+        self._submit(self._do_go(cue, lead_ms))
         self._update_cue_labels()
 
     async def _do_go(self, cue, lead_ms: int) -> None:
         await self.server.send_load_cue(cue)
         await asyncio.sleep(lead_ms / 1000.0 * 0.5)
-        await self.server.send_play_at(cue.id, lead_ms)
+        await self.server.send_play_at(cue.id, lead_ms, cue.start_time_ms)
 
     def _on_prev(self) -> None:
         cue = self.state.go_prev()
         if cue:
             lead_ms = self.state.show.sync.start_lead_ms if self.state.show else 250
-            asyncio.run_coroutine_threadsafe(self._do_go(cue, lead_ms), self.loop)
+            self._submit(self._do_go(cue, lead_ms))
         self._update_cue_labels()
 
     def _on_pause(self) -> None:
-        asyncio.run_coroutine_threadsafe(self.server.send_pause(), self.loop)
+        self._submit(self.server.send_pause())
 
     def _on_stop(self) -> None:
         """STOP button: stop playback and go to black."""
-        asyncio.run_coroutine_threadsafe(self.server.send_stop(), self.loop)
-        asyncio.run_coroutine_threadsafe(self.server.send_blackout(True), self.loop)
+        self._submit(self.server.send_stop())
+        self._submit(self.server.send_blackout(True))
 
     def _on_jump(self) -> None:
-        cue_id = self.cue_selector.currentData()
+        cue_id = self.cue_selector.currentData(Qt.UserRole)
         if cue_id:
             cue = self.state.jump_to_cue(cue_id)
             if cue:
                 lead_ms = self.state.show.sync.start_lead_ms if self.state.show else 250
-                asyncio.run_coroutine_threadsafe(self._do_go(cue, lead_ms), self.loop)
+                self._submit(self._do_go(cue, lead_ms))
         self._update_cue_labels()
 
     def _on_timeline_pressed(self) -> None:
@@ -223,7 +318,7 @@ class RunModeWidget(QWidget):
         """User released the timeline slider - seek to that position."""
         self._timeline_dragging = False
         position_ms = self.timeline_slider.value()
-        asyncio.run_coroutine_threadsafe(self.server.send_seek(position_ms), self.loop)
+        self._submit(self.server.send_seek(position_ms))
 
     def _update_timeline_position(self, position_ms: int) -> None:
         """Update timeline slider and label based on current position."""
@@ -8,7 +8,7 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QListWidget, QListWidgetItem, QGroupBox, QFormLayout,
     QLineEdit, QComboBox, QSpinBox, QCheckBox, QTextEdit,
-    QSplitter, QMessageBox, QSizePolicy,
+    QSplitter, QMessageBox, QSizePolicy, QListView, QAbstractItemView,
 )
 
 from controller.app_state import AppState
@@ -63,6 +63,11 @@ class ShowEditorWidget(QWidget):
         left_layout.addWidget(QLabel("Cue List"))
 
         self.cue_list = QListWidget()
+        # All rows are single-line text in the same font: skip per-row measuring
+        self.cue_list.setUniformItemSizes(True)
+        self.cue_list.setLayoutMode(QListView.Batched)
+        self.cue_list.setBatchSize(100)
+        self.cue_list.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.cue_list.currentRowChanged.connect(self._on_cue_selected)
         left_layout.addWidget(self.cue_list)
 
@@ -72,7 +77,7 @@ class ShowEditorWidget(QWidget):
         self.btn_del = QPushButton("Delete")
         self.btn_up = QPushButton("▲")
         self.btn_down = QPushButton("▼")
-        for btn in [self.btn_add, self.btn_dup, self.btn_del, self.btn_up, self.btn_down]:
+        for btn in (self.btn_add, self.btn_dup, self.btn_del, self.btn_up, self.btn_down):
             btn_row.addWidget(btn)
         left_layout.addLayout(btn_row)
 
@@ -84,7 +89,21 @@ class ShowEditorWidget(QWidget):
 
         splitter.addWidget(left)
 
-        # Right: cue detail
+        # Right: cue detail, built on first selection (see _ensure_detail_pane)
+        self._detail_placeholder = QLabel("Select a cue to edit its details.")
+        self._detail_placeholder.setAlignment(Qt.AlignCenter)
+        self._detail_built = False
+        splitter.addWidget(self._detail_placeholder)
+        splitter.setSizes([350, 650])
+        self._splitter = splitter
+
+        layout.addWidget(splitter)
+
+    def _ensure_detail_pane(self) -> None:
+        """Build the cue detail form the first time a cue is selected."""
+        if self._detail_built:
+            return
+        self._detail_built = True
         right = QGroupBox("Cue Detail")
         right_layout = QFormLayout(right)
 
@@ -99,7 +118,6 @@ class ShowEditorWidget(QWidget):
         self.fld_end_ms.setPlaceholderText("(optional)")
         self.fld_volume = QSpinBox()
         self.fld_volume.setRange(0, 100)
-        self.fld_volume.setValue(100)
         self.fld_loop = QCheckBox()
         self.fld_fade_in = QSpinBox()
         self.fld_fade_in.setRange(0, 60000)
@@ -131,13 +149,10 @@ class ShowEditorWidget(QWidget):
         self.validation_label.setStyleSheet("color: red;")
         right_layout.addRow(self.validation_label)
 
-        splitter.addWidget(right)
-        splitter.setSizes([350, 650])
-
-        layout.addWidget(splitter)
+        self._splitter.replaceWidget(1, right)
+        self._detail_placeholder.deleteLater()
 
     def refresh(self) -> None:
-        self.cue_list.clear()
         self._current_cue = None
         if self.state.show:
             # Load global settings
@@ -145,16 +160,41 @@ class ShowEditorWidget(QWidget):
             self.settings_default_volume.setValue(self.state.show.settings.default_volume)
             self.settings_default_fade_in.setValue(self.state.show.settings.default_fade_in_ms)
             self.settings_default_fade_out.setValue(self.state.show.settings.default_fade_out_ms)
-            
-            # Load cues
+        self._full_rebuild()
+
+    def _full_rebuild(self) -> None:
+        """Rebuild the whole cue list; only needed when a show is (re)loaded."""
+        self.cue_list.setUpdatesEnabled(False)
+        self.cue_list.clear()
+        if self.state.show:
             for cue in self.state.show.cues:
-                self.cue_list.addItem(f"[{cue.id}] {cue.name} ({cue.type})")
+                self.cue_list.addItem(self._make_cue_item(cue))
+        self.cue_list.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _cue_text(cue: Cue) -> str:
+        return f"[{cue.id}] {cue.name} ({cue.type})"
+
+    def _make_cue_item(self, cue: Cue) -> QListWidgetItem:
+        item = QListWidgetItem(self._cue_text(cue))
+        item.setData(Qt.UserRole, cue)
+        return item
+
+    def _move_row(self, src: int, dst: int) -> None:
+        """Move a single list row without triggering intermediate selection changes."""
+        self.cue_list.setUpdatesEnabled(False)
+        self.cue_list.blockSignals(True)
+        self.cue_list.insertItem(dst, self.cue_list.takeItem(src))
+        self.cue_list.blockSignals(False)
+        self.cue_list.setUpdatesEnabled(True)
 
     def _on_cue_selected(self, row: int) -> None:
-        if self.state.show is None or row < 0 or row >= len(self.state.show.cues):
+        item = self.cue_list.item(row) if row >= 0 else None
+        if self.state.show is None or item is None:
             self._current_cue = None
             return
-        self._current_cue = self.state.show.cues[row]
+        self._ensure_detail_pane()
+        self._current_cue = item.data(Qt.UserRole)
         c = self._current_cue
         self.fld_id.setText(c.id)
         self.fld_name.setText(c.name)
@@ -189,12 +229,16 @@ class ShowEditorWidget(QWidget):
         c.auto_follow_ms = int(af_text) if af_text.isdigit() else None
         c.notes = self.fld_notes.toPlainText()
 
+        if self.state.show is not None:
+            self.state.show.reindex()
         errors = c.validate()
         if errors:
             self.validation_label.setText("\n".join(errors))
         else:
             self.validation_label.setText("")
-            self.refresh()
+            item = self.cue_list.currentItem()
+            if item is not None:
+                item.setText(self._cue_text(c))
 
     def _add_cue(self) -> None:
         if self.state.show is None:
@@ -210,8 +254,8 @@ class ShowEditorWidget(QWidget):
             fade_in_ms=self.state.show.settings.default_fade_in_ms,
             fade_out_ms=self.state.show.settings.default_fade_out_ms,
         )
-        self.state.show.cues.append(cue)
-        self.refresh()
+        self.state.show.add_cue(cue)
+        self.cue_list.addItem(self._make_cue_item(cue))
         self.cue_list.setCurrentRow(len(self.state.show.cues) - 1)
 
     def _apply_settings(self) -> None:
@@ -230,27 +274,26 @@ class ShowEditorWidget(QWidget):
         import copy, uuid
         new_cue = copy.deepcopy(self._current_cue)
         new_cue.id = f"{new_cue.id}-copy-{uuid.uuid4().hex[:4]}"
-        idx = self.state.show.cues.index(self._current_cue)
-        self.state.show.cues.insert(idx + 1, new_cue)
-        self.refresh()
+        idx = self.cue_list.currentRow()
+        self.state.show.insert_cue(idx + 1, new_cue)
+        self.cue_list.insertItem(idx + 1, self._make_cue_item(new_cue))
         self.cue_list.setCurrentRow(idx + 1)
 
     def _del_cue(self) -> None:
         if self.state.show is None or self._current_cue is None:
             return
         row = self.cue_list.currentRow()
-        self.state.show.cues.pop(row)
+        self.state.show.remove_cue(row)
         self._current_cue = None
-        self.refresh()
+        self.cue_list.takeItem(row)
 
     def _move_up(self) -> None:
         if self.state.show is None:
             return
         row = self.cue_list.currentRow()
         if row > 0:
-            cues = self.state.show.cues
-            cues[row - 1], cues[row] = cues[row], cues[row - 1]
-            self.refresh()
+            self.state.show.swap_cues(row - 1, row)
+            self._move_row(row, row - 1)
             self.cue_list.setCurrentRow(row - 1)
 
     def _move_down(self) -> None:
@@ -258,7 +301,7 @@ class ShowEditorWidget(QWidget):
             return
         row = self.cue_list.currentRow()
         cues = self.state.show.cues
-        if row < len(cues) - 1:
-            cues[row], cues[row + 1] = cues[row + 1], cues[row]
-            self.refresh()
+        if 0 <= row < len(cues) - 1:
+            self.state.show.swap_cues(row, row + 1)
+            self._move_row(row, row + 1)
             self.cue_list.setCurrentRow(row + 1)
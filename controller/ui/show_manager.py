@@ -22,6 +22,7 @@ class ShowManagerWidget(QWidget):
     def __init__(self, state: AppState, parent=None):
         super().__init__(parent)
         self.state = state
+        self._last_recent: list[str] = []
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -71,9 +72,22 @@ class ShowManagerWidget(QWidget):
         layout.addStretch()
 
     def refresh_recent(self) -> None:
-        self.recent_list.clear()
-        for path in self.state.recent_shows:
-            self.recent_list.addItem(path)
+        """Sync the recent list with state, touching only rows that changed."""
+        new = list(self.state.recent_shows)
+        if new == self._last_recent:
+            return
+        lst = self.recent_list
+        lst.setUpdatesEnabled(False)
+        while lst.count() > len(new):
+            lst.takeItem(lst.count() - 1)
+        for i, path in enumerate(new):
+            if i < lst.count():
+                if self._last_recent[i] != path:
+                    lst.item(i).setText(path)
+            else:
+                lst.addItem(path)
+        lst.setUpdatesEnabled(True)
+        self._last_recent = new
 
     def _open_recent(self, item: QListWidgetItem) -> None:
         p = Path(item.text())
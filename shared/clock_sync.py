@@ -1,20 +1,37 @@
 """CueMesh clock sync math (lightweight NTP-like over WebSocket)."""
 from __future__ import annotations
-import statistics
+import bisect
+import math
 import time
+from collections import deque
 from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import Optional
 
 
+def _sorted_median(values: list[float]) -> float:
+    """Median of an already-sorted, non-empty list."""
+    n = len(values)
+    mid = n // 2
+    if n % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2
+
+
+def now_ms() -> float:
+    """UTC wall-clock time in ms, keeping sub-ms precision from time.time_ns()."""
+    return time.time_ns() / 1_000_000
+
+
 @dataclass
 class SyncSample:
-    t1: int  # controller send time (utc ms)
-    t2: int  # client recv time (local ms)
-    t3: int  # client send time (local ms)
-    t4: int  # controller recv time (utc ms)
+    t1: float  # controller send time (utc ms)
+    t2: float  # client recv time (local ms)
+    t3: float  # client send time (local ms)
+    t4: float  # controller recv time (utc ms)
 
     @property
-    def rtt_ms(self) -> int:
+    def rtt_ms(self) -> float:
         return (self.t4 - self.t1) - (self.t3 - self.t2)
 
     @property
@@ -30,28 +47,33 @@ class ClockSyncState:
     OUTLIER_FACTOR = 2.0
 
     def __init__(self) -> None:
-        self._samples: list[SyncSample] = []
+        self._samples: deque[SyncSample] = deque(maxlen=self.WINDOW)
+        # (rtt_ms, offset_ms) for the samples in the window, kept sorted by RTT
+        self._by_rtt: list[tuple[float, float]] = []
         self._offset_ms: float = 0.0
 
     def add_sample(self, sample: SyncSample) -> None:
+        if len(self._samples) == self._samples.maxlen:
+            old = self._samples[0]
+            del self._by_rtt[bisect.bisect_left(self._by_rtt, (old.rtt_ms, old.offset_ms))]
         self._samples.append(sample)
-        if len(self._samples) > self.WINDOW:
-            self._samples.pop(0)
+        bisect.insort(self._by_rtt, (sample.rtt_ms, sample.offset_ms))
         self._recompute()
 
     def _recompute(self) -> None:
-        if not self._samples:
+        by_rtt = self._by_rtt
+        if not by_rtt:
             return
-        offsets = [s.offset_ms for s in self._samples]
-        rtts = [s.rtt_ms for s in self._samples]
-        # Reject high-RTT outliers
-        if len(rtts) >= 3:
-            median_rtt = statistics.median(rtts)
-            good = [s for s in self._samples if s.rtt_ms <= median_rtt * self.OUTLIER_FACTOR]
+        # Reject high-RTT outliers: the window is already sorted by RTT, so the
+        # accepted samples are a prefix up to median_rtt * OUTLIER_FACTOR.
+        if len(by_rtt) >= 3:
+            median_rtt = _sorted_median([rtt for rtt, _ in by_rtt])
+            cut = bisect.bisect_right(by_rtt, median_rtt * self.OUTLIER_FACTOR, key=itemgetter(0))
+            good = by_rtt[:cut]
         else:
-            good = self._samples
+            good = by_rtt
         if good:
-            self._offset_ms = statistics.median([s.offset_ms for s in good])
+            self._offset_ms = _sorted_median(sorted(off for _, off in good))
 
     @property
     def offset_ms(self) -> float:
@@ -61,7 +83,7 @@ class ClockSyncState:
     def master_now_ms(self, local_utc_ms: Optional[int] = None) -> int:
         """Convert local UTC ms to estimated master time ms."""
         if local_utc_ms is None:
-            local_utc_ms = int(time.time() * 1000)
+            local_utc_ms = time.time_ns() // 1_000_000
         return int(local_utc_ms - self._offset_ms)
 
     @property
@@ -91,11 +113,8 @@ def compute_drift_correction(
         # drift > 0 means playing ahead: slow down (rate < 1)
         # drift < 0 means playing behind: speed up (rate > 1)
         scale = abs_drift / max_drift_ms
-        if drift_ms > 0:
-            rate = 1.0 - scale * (1.0 - rate_min)
-            rate = max(rate_min, rate)
-        else:
-            rate = 1.0 + scale * (rate_max - 1.0)
-            rate = min(rate_max, rate)
+        bound = rate_min if drift_ms > 0 else rate_max
+        rate = 1.0 + math.copysign(scale * abs(1.0 - bound), -drift_ms)
+        rate = min(rate_max, max(rate_min, rate))
         return "rate_adjust", round(rate, 4)
     return "none", 1.0
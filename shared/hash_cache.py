@@ -0,0 +1,37 @@
+"""CueMesh persistent SHA-256 cache for media manifests."""
+from __future__ import annotations
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger("cuemesh.hash_cache")
+
+DEFAULT_CACHE_PATH = Path.home() / ".cuemesh" / "manifest-hashes.json"
+
+# resolved_path -> (st_mtime_ns, st_size, sha256_hex)
+HashCache = dict[str, tuple[int, int, str]]
+
+
+def load_cache(cache_path: Path = DEFAULT_CACHE_PATH) -> HashCache:
+    """Load a hash cache from disk; returns an empty cache if missing or unreadable."""
+    if not cache_path.exists():
+        return {}
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        return {k: (int(v[0]), int(v[1]), str(v[2])) for k, v in raw.items()}
+    except Exception as e:
+        logger.warning("Failed to load hash cache %s: %s", cache_path, e)
+        return {}
+
+
+def save_cache(cache: HashCache, cache_path: Path = DEFAULT_CACHE_PATH) -> None:
+    """Persist a hash cache to disk."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(cache_path.suffix + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({k: list(v) for k, v in cache.items()}, f)
+        tmp.replace(cache_path)
+    except Exception as e:
+        logger.warning("Failed to save hash cache %s: %s", cache_path, e)
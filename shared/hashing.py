@@ -1,27 +1,89 @@
-"""CueMesh file hashing utilities for preflight validation."""
+"""
+CueMesh file hashing utilities for preflight validation.
+
+SHA-256 goes through hashlib.file_digest, which uses CPython's OpenSSL
+backend; OpenSSL >= 1.1.1 dispatches to SHA-NI / ARMv8 crypto instructions
+when the CPU has them.
+"""
 from __future__ import annotations
+import functools
 import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from shared.hash_cache import HashCache
+
+MAX_HASH_WORKERS = 8
+
+
+def sha256_bytes(data: bytes) -> str:
+    """Compute SHA-256 hex digest of an in-memory buffer."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path: str | os.PathLike, chunk_size: int = 1 << 20) -> str:
+    """
+    Compute SHA-256 hex digest of a file.
+    Results are memoized in-process by (path, mtime_ns, size), so re-hashing an
+    unchanged file costs one stat. chunk_size is accepted for backwards
+    compatibility and ignored.
+    """
+    st = os.stat(path)
+    return _sha256_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
 
-def sha256_file(path: Path, chunk_size: int = 65536) -> str:
-    """Compute SHA-256 hex digest of a file."""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        while chunk := f.read(chunk_size):
-            h.update(chunk)
-    return h.hexdigest()
+@functools.lru_cache(maxsize=1024)
+def _sha256_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    # mtime_ns is only part of the cache key: a modified file misses the cache.
+    # No mmap here: a file truncated mid-hash (media being re-copied during
+    # preflight) would raise SIGBUS and kill the process.
+    with open(path_str, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
-def build_media_manifest(media_root: Path, cue_files: list[str]) -> dict[str, str | None]:
+def build_media_manifest(
+    media_root: Path, cue_files: list[str], cache: HashCache | None = None, prune: bool = False
+) -> dict[str, str | None]:
     """
     Returns dict mapping relative_path -> sha256_hex (or None if missing).
+    Files are hashed concurrently; hashlib releases the GIL while digesting.
+    If a cache is given, digests whose (mtime_ns, size) still match are reused,
+    and the cache is updated in place with any newly computed digests. With
+    prune=True, entries for files outside this manifest are dropped from it.
     """
-    manifest = {}
+    manifest: dict[str, str | None] = {}
+    to_hash = []
+    # Resolve the root once; per-file paths are plain strings, not Path objects
+    root_str = os.path.realpath(media_root)
+    join, normpath = os.path.join, os.path.normpath
+    seen: set[str] = set()
     for rel in cue_files:
-        p = (media_root / rel).resolve()
-        if p.exists():
-            manifest[rel] = sha256_file(p)
+        p = normpath(join(root_str, rel))
+        seen.add(p)
+        try:
+            st = os.stat(p)
+        except OSError:
+            manifest[rel] = None
+            continue
+        entry = cache.get(p) if cache is not None else None
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            manifest[rel] = entry[2]
         else:
             manifest[rel] = None
+            to_hash.append((rel, p, st))
+    if prune and cache is not None:
+        for stale in [k for k in cache if k not in seen]:
+            del cache[stale]
+    if not to_hash:
+        return manifest
+
+    def _hash(item: tuple[str, str, os.stat_result]) -> tuple[str, str]:
+        return item[0], sha256_file(item[1])
+
+    with ThreadPoolExecutor(max_workers=min(MAX_HASH_WORKERS, len(to_hash))) as ex:
+        for (rel, digest), (_, p, st) in zip(ex.map(_hash, to_hash), to_hash):
+            manifest[rel] = digest
+            if cache is not None:
+                cache[p] = (st.st_mtime_ns, st.st_size, digest)
     return manifest
@@ -0,0 +1,164 @@
+"""CueMesh background JSONL writer: producers enqueue, one thread does the file I/O."""
+from __future__ import annotations
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+try:
+    import orjson
+
+    def _encode_fast(record: dict) -> bytes:
+        return orjson.dumps(record) + b"\n"
+except ImportError:
+    def _encode_fast(record: dict) -> bytes:
+        return (json.dumps(record) + "\n").encode("utf-8")
+
+
+def _encode(record: dict) -> bytes:
+    try:
+        return _encode_fast(record)
+    except Exception:
+        # e.g. orjson rejects non-str keys; stringify whatever json can't encode
+        return (json.dumps(record, default=str) + "\n").encode("utf-8")
+
+
+logger = logging.getLogger("cuemesh.jsonl_writer")
+
+FLUSH_INTERVAL_S = 0.5
+IDLE_CLOSE_S = 60.0  # files not written for this long are closed until needed again
+
+_queue: queue.SimpleQueue = queue.SimpleQueue()
+_thread: Optional[threading.Thread] = None
+_start_lock = threading.Lock()
+
+
+def submit(log_dir: Path, record: dict) -> None:
+    """Queue a record for the daily JSONL file in log_dir. Never blocks on disk."""
+    if _thread is None:
+        _start()
+    _queue.put((log_dir, record))
+
+
+class _Barrier:
+    """Queue marker: set once everything queued before it is on disk."""
+    __slots__ = ("done", "close")
+
+    def __init__(self, close: bool):
+        self.done = threading.Event()
+        self.close = close
+
+
+def flush(timeout: float = 5.0) -> bool:
+    """Block until everything queued so far has been written and flushed."""
+    return _barrier(False, timeout)
+
+
+def close(timeout: float = 5.0) -> bool:
+    """Like flush(), but also close every open log file (reopened on next submit)."""
+    return _barrier(True, timeout)
+
+
+def _barrier(close_files: bool, timeout: float) -> bool:
+    if _thread is None:
+        return True
+    barrier = _Barrier(close_files)
+    _queue.put(barrier)
+    return barrier.done.wait(timeout)
+
+
+def _start() -> None:
+    global _thread
+    with _start_lock:
+        if _thread is None:
+            t = threading.Thread(target=_run, name="cuemesh-jsonl", daemon=True)
+            t.start()
+            _thread = t
+            atexit.register(close)
+
+
+def _open_daily(files: dict[Path, tuple[str, BinaryIO]], log_dir: Path) -> BinaryIO:
+    """Return the open file for today's log in log_dir, rotating at midnight."""
+    date_str = time.strftime("%Y-%m-%d")
+    current = files.get(log_dir)
+    if current is not None:
+        if current[0] == date_str:
+            return current[1]
+        current[1].close()
+    log_dir.mkdir(parents=True, exist_ok=True)
+    fh = open(log_dir / f"cuemesh-{date_str}.jsonl", "ab", buffering=1 << 16)
+    files[log_dir] = (date_str, fh)
+    return fh
+
+
+def _close_files(files: dict[Path, tuple[str, BinaryIO]], dirs) -> None:
+    for log_dir in list(dirs):
+        try:
+            files.pop(log_dir)[1].close()
+        except Exception as e:
+            logger.warning("Failed to close JSONL log in %s: %s", log_dir, e)
+
+
+def _run() -> None:
+    files: dict[Path, tuple[str, BinaryIO]] = {}
+    last_write: dict[Path, float] = {}
+    dirty = False
+    last_flush = time.monotonic()
+    while True:
+        # Block for one item, then drain whatever else is already queued
+        try:
+            items = [_queue.get(timeout=FLUSH_INTERVAL_S)]
+        except queue.Empty:
+            items = []
+        try:
+            while True:
+                items.append(_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        barriers = []
+        batches: dict[Path, list[bytes]] = {}
+        dropped = 0
+        for item in items:
+            if isinstance(item, _Barrier):
+                barriers.append(item)
+                continue
+            log_dir, record = item
+            try:
+                batches.setdefault(log_dir, []).append(_encode(record))
+            except Exception:
+                dropped += 1  # logging must never take the writer thread down
+        if dropped:
+            logger.warning("Dropped %d unencodable JSONL record(s)", dropped)
+        # One write per file per batch; the date rotation check runs once per batch too
+        now = time.monotonic()
+        for log_dir, chunks in batches.items():
+            try:
+                _open_daily(files, log_dir).write(b"".join(chunks))
+                last_write[log_dir] = now
+                dirty = True
+            except Exception as e:
+                logger.warning("Dropped %d JSONL record(s) for %s: %s", len(chunks), log_dir, e)
+
+        if barriers or (dirty and now - last_flush >= FLUSH_INTERVAL_S):
+            for log_dir, (_, fh) in list(files.items()):
+                try:
+                    fh.flush()
+                except Exception as e:
+                    logger.warning("Failed to flush JSONL log in %s: %s", log_dir, e)
+            dirty = False
+            last_flush = now
+        if any(b.close for b in barriers):
+            _close_files(files, files.keys())
+        else:
+            # Don't hold handles on directories nobody is logging to any more
+            idle = [d for d in files if now - last_write.get(d, now) >= IDLE_CLOSE_S]
+            _close_files(files, idle)
+            for log_dir in idle:
+                last_write.pop(log_dir, None)
+        for barrier in barriers:
+            barrier.done.set()
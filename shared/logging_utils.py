@@ -1,43 +1,78 @@
 """CueMesh logging utilities."""
 from __future__ import annotations
+import atexit
+import functools
 import logging
 import logging.handlers
-import json
-import time
+import queue
 from pathlib import Path
 
+from shared import jsonl_writer
 
-def setup_rotating_logger(name: str, log_dir: Path, level: int = logging.DEBUG) -> logging.Logger:
-    """Set up a rotating file logger + console output."""
+
+_FORMATTER = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+# logger name -> (logger, its QueueHandler, listener draining the queue onto file + console)
+_listeners: dict[
+    str, tuple[logging.Logger, logging.handlers.QueueHandler, logging.handlers.QueueListener]
+] = {}
+
+
+@functools.lru_cache(maxsize=32)
+def _ensure_dir(log_dir: Path) -> Path:
     log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = log_dir / f"{name}.log"
+    return log_dir
+
 
+def setup_rotating_logger(name: str, log_dir: Path, level: int = logging.DEBUG) -> logging.Logger:
+    """
+    Set up a rotating file logger + console output.
+    The logger itself only enqueues records; a background QueueListener does the I/O.
+    """
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
     if not logger.handlers:
+        log_file = _ensure_dir(log_dir) / f"{name}.log"
+
         # Rotating file handler: 5MB x 5 files
         fh = logging.handlers.RotatingFileHandler(
             log_file, maxBytes=5 * 1024 * 1024, backupCount=5, encoding="utf-8"
         )
         fh.setLevel(level)
-        fmt = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
-        fh.setFormatter(fmt)
-        logger.addHandler(fh)
+        fh.setFormatter(_FORMATTER)
 
         # Console handler
         ch = logging.StreamHandler()
         ch.setLevel(logging.INFO)
-        ch.setFormatter(fmt)
-        logger.addHandler(ch)
+        ch.setFormatter(_FORMATTER)
+
+        q: queue.Queue = queue.Queue(-1)
+        qh = logging.handlers.QueueHandler(q)
+        logger.addHandler(qh)
+        listener = logging.handlers.QueueListener(q, fh, ch, respect_handler_level=True)
+        listener.start()
+        if not _listeners:
+            atexit.register(shutdown_logging)
+        _listeners[name] = (logger, qh, listener)
 
     return logger
 
 
+def shutdown_logging() -> None:
+    """
+    Stop background log listeners, flushing anything still queued.
+    Each logger's QueueHandler is detached too, so setup_rotating_logger can
+    set it up again afterwards.
+    """
+    while _listeners:
+        _, (logger, qh, listener) = _listeners.popitem()
+        logger.removeHandler(qh)
+        listener.stop()
+        for h in listener.handlers:
+            h.close()
+
+
 def log_jsonl(log_dir: Path, record: dict) -> None:
-    """Append a JSONL log record to a daily log file."""
-    log_dir.mkdir(parents=True, exist_ok=True)
-    date_str = time.strftime("%Y-%m-%d")
-    log_file = log_dir / f"cuemesh-{date_str}.jsonl"
-    with open(log_file, "a", encoding="utf-8") as f:
-        f.write(json.dumps(record) + "\n")
+    """Append a JSONL log record to a daily log file (written by a background thread)."""
+    jsonl_writer.submit(log_dir, record)
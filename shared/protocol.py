@@ -1,22 +1,80 @@
 """CueMesh network protocol definitions."""
 from __future__ import annotations
 import json
+import sys
 import time
 from dataclasses import dataclass, field, asdict
 from typing import Any
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # Non-str keys, ints beyond 64 bits, ...: same output as without orjson
+            return json.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    msgpack = None
+    HAS_MSGPACK = False
+
+
+_time_ns = time.time_ns
+
 
 def _now_ms() -> int:
-    return int(time.time() * 1000)
+    return _time_ns() // 1_000_000
+
+
+# msg_type -> '{"type":"<msg_type>","ts_utc_ms":' (JSON-escaped once, then reused)
+_ENVELOPE_PREFIXES: dict[str, str] = {}
+
+
+def _envelope_prefix(msg_type: str) -> str:
+    prefix = _ENVELOPE_PREFIXES.get(msg_type)
+    if prefix is None:
+        prefix = _ENVELOPE_PREFIXES[msg_type] = '{"type":' + _dumps(msg_type) + ',"ts_utc_ms":'
+    return prefix
 
 
 def make_envelope(msg_type: str, payload: dict[str, Any]) -> str:
-    return json.dumps({"type": msg_type, "ts_utc_ms": _now_ms(), "payload": payload})
+    # Only the payload goes through the JSON encoder; the wrapper is a template.
+    # Empty payloads (PAUSE, STOP, REQUEST_STATUS, ...) skip the encoder entirely.
+    body = _dumps(payload) if payload else "{}"
+    return f'{_envelope_prefix(msg_type)}{_now_ms()},"payload":{body}}}'
+
+
+def parse_envelope(raw: str | bytes) -> tuple[str, int, dict[str, Any]]:
+    data = _loads(raw)
+    # Interned so it is the same object as the matching MSG_* constant
+    return sys.intern(data["type"]), data.get("ts_utc_ms", 0), data.get("payload", {})
+
+
+def make_envelope_binary(msg_type: str, payload: dict[str, Any]) -> bytes:
+    """msgpack-encoded envelope, for peers that advertised the "msgpack" capability."""
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.packb(
+        {"type": msg_type, "ts_utc_ms": _now_ms(), "payload": payload}, use_bin_type=True
+    )
 
 
-def parse_envelope(raw: str) -> tuple[str, int, dict[str, Any]]:
-    data = json.loads(raw)
-    return data["type"], data.get("ts_utc_ms", 0), data.get("payload", {})
+def parse_envelope_binary(raw: bytes) -> tuple[str, int, dict[str, Any]]:
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    data = msgpack.unpackb(raw, raw=False)
+    return sys.intern(data["type"]), data.get("ts_utc_ms", 0), data.get("payload", {})
 
 
 # ---- Controller → Client message types ----
@@ -55,4 +113,4 @@ STATE_PAUSED = "paused"
 STATE_ERROR = "error"
 STATE_BLACK = "black"
 
-VALID_STATES = {STATE_IDLE, STATE_LOADING, STATE_READY, STATE_PLAYING, STATE_PAUSED, STATE_ERROR, STATE_BLACK}
+VALID_STATES = frozenset({STATE_IDLE, STATE_LOADING, STATE_READY, STATE_PLAYING, STATE_PAUSED, STATE_ERROR, STATE_BLACK})
@@ -1,14 +1,19 @@
 """CueMesh show file (TOML) parsing and validation."""
 from __future__ import annotations
-import tomllib
+import copy
+import functools
+from collections import Counter
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Optional
 import datetime
+import os
 import re
 
+_CUE_ID_RE = re.compile(r"[A-Za-z0-9_\-]+")
 
-@dataclass
+
+@dataclass(slots=True)
 class SyncCorrection:
     rate_min: float = 0.98
     rate_max: float = 1.02
@@ -16,7 +21,7 @@ class SyncCorrection:
     sync_interval_ms: int = 1000
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncConfig:
     mode: str = "medium"
     max_drift_ms: int = 150
@@ -24,13 +29,13 @@ class SyncConfig:
     correction: SyncCorrection = field(default_factory=SyncCorrection)
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientEntry:
     id: str = ""
     name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class GlobalSettings:
     """Global show settings for defaults and display options."""
     fullscreen: bool = True
@@ -39,7 +44,7 @@ class GlobalSettings:
     default_fade_out_ms: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Cue:
     id: str = ""
     name: str = ""
@@ -58,7 +63,7 @@ class Cue:
         errors = []
         if not self.id:
             errors.append("Cue missing 'id'")
-        if not re.match(r'^[a-zA-Z0-9_\-]+$', self.id or "x"):
+        if self.id and not _CUE_ID_RE.fullmatch(self.id):
             errors.append(f"Cue id '{self.id}' contains invalid characters")
         if self.type not in ("video", "image"):
             errors.append(f"Cue '{self.id}': type must be 'video' or 'image'")
@@ -69,7 +74,7 @@ class Cue:
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class Show:
     title: str = "Untitled Show"
     version: int = 1
@@ -81,6 +86,51 @@ class Show:
     settings: GlobalSettings = field(default_factory=GlobalSettings)
     clients: list[ClientEntry] = field(default_factory=list)
     cues: list[Cue] = field(default_factory=list)
+    # cue id -> first index, for jump-by-id. Rebuilt by the cue mutators below;
+    # index_of() checks every hit against cues, so in-place edits can't make it
+    # return a wrong cue.
+    _index: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.reindex()
+
+    def reindex(self) -> None:
+        """Rebuild the id -> index map from cues."""
+        index: dict[str, int] = {}
+        for i, cue in enumerate(self.cues):
+            index.setdefault(cue.id, i)
+        self._index = index
+
+    @property
+    def cue_ids(self) -> list[str]:
+        return [c.id for c in self.cues]
+
+    def index_of(self, cue_id: str) -> Optional[int]:
+        """Index of the first cue with this id, or None."""
+        i = self._index.get(cue_id)
+        if i is not None and i < len(self.cues) and self.cues[i].id == cue_id:
+            return i
+        # Miss or stale hit: cues were edited directly, rebuild and look again
+        self.reindex()
+        return self._index.get(cue_id)
+
+    def add_cue(self, cue: Cue) -> None:
+        self.cues.append(cue)
+        self._index.setdefault(cue.id, len(self.cues) - 1)
+
+    def insert_cue(self, idx: int, cue: Cue) -> None:
+        self.cues.insert(idx, cue)
+        self.reindex()
+
+    def remove_cue(self, idx: int) -> Cue:
+        cue = self.cues.pop(idx)
+        self.reindex()
+        return cue
+
+    def swap_cues(self, i: int, j: int) -> None:
+        cues = self.cues
+        cues[i], cues[j] = cues[j], cues[i]
+        self.reindex()
 
     def validate(self) -> list[str]:
         errors = []
@@ -88,22 +138,24 @@ class Show:
             errors.append(f"Invalid dropout_policy: {self.dropout_policy}")
         if self.sync.mode != "medium":
             errors.append(f"Invalid sync.mode: {self.sync.mode}")
-        ids_seen = set()
-        for cue in self.cues:
-            cue_errors = cue.validate()
-            errors.extend(cue_errors)
-            if cue.id in ids_seen:
-                errors.append(f"Duplicate cue id: {cue.id}")
-            ids_seen.add(cue.id)
+        errors.extend([e for cue in self.cues for e in cue.validate()])
+        for cue_id, n in Counter(c.id for c in self.cues).items():
+            if n > 1:
+                errors.append(f"Duplicate cue id: {cue_id} (×{n})")
         return errors
 
     def validate_media_paths(self, base_path: Path) -> list[tuple[str, str, bool]]:
         """Returns list of (cue_id, resolved_path, exists)."""
-        media_root = (base_path / self.media_root).resolve()
+        root_str = str((base_path / self.media_root).resolve())
         results = []
         for cue in self.cues:
-            resolved = (media_root / cue.file).resolve()
-            results.append((cue.id, str(resolved), resolved.exists()))
+            p = os.path.normpath(os.path.join(root_str, cue.file))
+            try:
+                os.stat(p)
+                exists = True
+            except OSError:
+                exists = False
+            results.append((cue.id, p, exists))
         return results
 
 
@@ -123,26 +175,29 @@ def _parse_sync(raw: dict) -> SyncConfig:
     )
 
 
+_CUE_FIELDS = frozenset(f.name for f in fields(Cue) if f.init)
+
+
 def _parse_cue(raw: dict) -> Cue:
-    return Cue(
-        id=raw.get("id", ""),
-        name=raw.get("name", ""),
-        type=raw.get("type", "video"),
-        file=raw.get("file", ""),
-        start_time_ms=raw.get("start_time_ms", 0),
-        end_time_ms=raw.get("end_time_ms", None),
-        volume=raw.get("volume", 100),
-        loop=raw.get("loop", False),
-        fade_in_ms=raw.get("fade_in_ms", 0),
-        fade_out_ms=raw.get("fade_out_ms", 0),
-        auto_follow_ms=raw.get("auto_follow_ms", None),
-        notes=raw.get("notes", ""),
-    )
+    # Cue's own defaults cover missing keys; unknown keys are ignored
+    return Cue(**{k: v for k, v in raw.items() if k in _CUE_FIELDS})
 
 
 def load_show(path: Path) -> Show:
-    """Load a .cuemesh.toml show file."""
-    with open(path, "rb") as f:
+    """
+    Load a .cuemesh.toml show file.
+    Parsed shows are cached by (path, mtime_ns, size); each call returns a
+    fresh deep copy, so callers may mutate the result freely.
+    """
+    st = os.stat(path)
+    return copy.deepcopy(_load_show_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_show_cached(path_str: str, mtime_ns: int, size: int) -> Show:
+    # mtime_ns and size are only part of the cache key: an edited file misses
+    import tomllib  # deferred: most importers only need the dataclasses
+    with open(path_str, "rb") as f:
         data = tomllib.load(f)
 
     show_raw = data.get("show", {})
@@ -173,6 +228,22 @@ def load_show(path: Path) -> Show:
     return show
 
 
+# TOML basic-string escapes: quote, backslash and all control characters
+_TOML_ESCAPES = {c: f"\\u{c:04X}" for c in [*range(0x20), 0x7F]}
+_TOML_ESCAPES.update({
+    ord('"'): '\\"', ord("\\"): "\\\\", ord("\b"): "\\b", ord("\t"): "\\t",
+    ord("\n"): "\\n", ord("\f"): "\\f", ord("\r"): "\\r",
+})
+
+
+def _toml_str(value: str) -> str:
+    return '"' + value.translate(_TOML_ESCAPES) + '"'
+
+
+def _toml_bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
 def save_show(show: Show, path: Path) -> None:
     """Save a Show object to a .cuemesh.toml file."""
     now = datetime.datetime.now(datetime.timezone.utc).isoformat()
@@ -180,56 +251,65 @@ def save_show(show: Show, path: Path) -> None:
         show.created_utc = now
     show.modified_utc = now
 
-    lines = []
-    lines.append("[show]")
-    lines.append(f'title = "{show.title}"')
-    lines.append(f"version = {show.version}")
-    lines.append(f'created_utc = "{show.created_utc}"')
-    lines.append(f'modified_utc = "{show.modified_utc}"')
-    lines.append(f'media_root = "{show.media_root}"')
-    lines.append(f'dropout_policy = "{show.dropout_policy}"')
-    lines.append("")
-    lines.append("[show.sync]")
-    lines.append(f'mode = "{show.sync.mode}"')
-    lines.append(f"max_drift_ms = {show.sync.max_drift_ms}")
-    lines.append(f"start_lead_ms = {show.sync.start_lead_ms}")
-    lines.append("")
-    lines.append("[show.sync.correction]")
-    lines.append(f"rate_min = {show.sync.correction.rate_min}")
-    lines.append(f"rate_max = {show.sync.correction.rate_max}")
-    lines.append(f"hard_seek_threshold_ms = {show.sync.correction.hard_seek_threshold_ms}")
-    lines.append(f"sync_interval_ms = {show.sync.correction.sync_interval_ms}")
-    lines.append("")
-    lines.append("[show.settings]")
-    lines.append(f"fullscreen = {str(show.settings.fullscreen).lower()}")
-    lines.append(f"default_volume = {show.settings.default_volume}")
-    lines.append(f"default_fade_in_ms = {show.settings.default_fade_in_ms}")
-    lines.append(f"default_fade_out_ms = {show.settings.default_fade_out_ms}")
-    lines.append("")
+    sync, corr, settings = show.sync, show.sync.correction, show.settings
+    chunks = [
+        "[show]\n"
+        f"title = {_toml_str(show.title)}\n"
+        f"version = {show.version}\n"
+        f"created_utc = {_toml_str(show.created_utc)}\n"
+        f"modified_utc = {_toml_str(show.modified_utc)}\n"
+        f"media_root = {_toml_str(show.media_root)}\n"
+        f"dropout_policy = {_toml_str(show.dropout_policy)}\n"
+        "\n"
+        "[show.sync]\n"
+        f"mode = {_toml_str(sync.mode)}\n"
+        f"max_drift_ms = {sync.max_drift_ms}\n"
+        f"start_lead_ms = {sync.start_lead_ms}\n"
+        "\n"
+        "[show.sync.correction]\n"
+        f"rate_min = {corr.rate_min}\n"
+        f"rate_max = {corr.rate_max}\n"
+        f"hard_seek_threshold_ms = {corr.hard_seek_threshold_ms}\n"
+        f"sync_interval_ms = {corr.sync_interval_ms}\n"
+        "\n"
+        "[show.settings]\n"
+        f"fullscreen = {_toml_bool(settings.fullscreen)}\n"
+        f"default_volume = {settings.default_volume}\n"
+        f"default_fade_in_ms = {settings.default_fade_in_ms}\n"
+        f"default_fade_out_ms = {settings.default_fade_out_ms}\n"
+        "\n"
+    ]
 
     for client in show.clients:
-        lines.append("[[clients]]")
-        lines.append(f'id = "{client.id}"')
-        lines.append(f'name = "{client.name}"')
-        lines.append("")
+        chunks.append(
+            "[[clients]]\n"
+            f"id = {_toml_str(client.id)}\n"
+            f"name = {_toml_str(client.name)}\n"
+            "\n"
+        )
 
     for cue in show.cues:
-        lines.append("[[cues]]")
-        lines.append(f'id = "{cue.id}"')
-        lines.append(f'name = "{cue.name}"')
-        lines.append(f'type = "{cue.type}"')
-        lines.append(f'file = "{cue.file}"')
-        lines.append(f"start_time_ms = {cue.start_time_ms}")
-        if cue.end_time_ms is not None:
-            lines.append(f"end_time_ms = {cue.end_time_ms}")
-        lines.append(f"volume = {cue.volume}")
-        lines.append(f"loop = {str(cue.loop).lower()}")
-        lines.append(f"fade_in_ms = {cue.fade_in_ms}")
-        lines.append(f"fade_out_ms = {cue.fade_out_ms}")
-        if cue.auto_follow_ms is not None:
-            lines.append(f"auto_follow_ms = {cue.auto_follow_ms}")
-        if cue.notes:
-            lines.append(f'notes = "{cue.notes}"')
-        lines.append("")
-
-    path.write_text("\n".join(lines), encoding="utf-8")
+        end = f"end_time_ms = {cue.end_time_ms}\n" if cue.end_time_ms is not None else ""
+        follow = f"auto_follow_ms = {cue.auto_follow_ms}\n" if cue.auto_follow_ms is not None else ""
+        notes = f"notes = {_toml_str(cue.notes)}\n" if cue.notes else ""
+        chunks.append(
+            "[[cues]]\n"
+            f"id = {_toml_str(cue.id)}\n"
+            f"name = {_toml_str(cue.name)}\n"
+            f"type = {_toml_str(cue.type)}\n"
+            f"file = {_toml_str(cue.file)}\n"
+            f"start_time_ms = {cue.start_time_ms}\n"
+            f"{end}"
+            f"volume = {cue.volume}\n"
+            f"loop = {_toml_bool(cue.loop)}\n"
+            f"fade_in_ms = {cue.fade_in_ms}\n"
+            f"fade_out_ms = {cue.fade_out_ms}\n"
+            f"{follow}{notes}"
+            "\n"
+        )
+
+    with path.open("w", encoding="utf-8", buffering=1 << 16) as f:
+        f.writelines(chunks)
+    # A same-size save within the filesystem's mtime granularity (1-2 s on FAT
+    # and HFS+) would otherwise still hit the pre-save entry
+    _load_show_cached.cache_clear()
@@ -108,3 +108,9 @@ def test_drift_correction_rate_clamped():
     )
     # Over threshold: hard seek
     assert action == "hard_seek"
+
+
+def test_sync_sample_sub_ms_precision():
+    s = SyncSample(t1=1000.25, t2=1010.5, t3=1010.75, t4=1020.5)
+    assert s.rtt_ms == pytest.approx(20.0)
+    assert s.offset_ms == pytest.approx(0.25)
@@ -0,0 +1,24 @@
+"""Tests for the persistent media hash cache."""
+import tempfile
+from pathlib import Path
+from shared.hash_cache import load_cache, save_cache
+
+
+def test_load_cache_missing():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assert load_cache(Path(tmpdir) / "none.json") == {}
+
+
+def test_save_and_load_cache():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "sub" / "hashes.json"
+        cache = {"/media/a.webm": (123456789, 42, "ab" * 32)}
+        save_cache(cache, path)
+        assert load_cache(path) == cache
+
+
+def test_load_cache_corrupt():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "hashes.json"
+        path.write_text("{not json")
+        assert load_cache(path) == {}
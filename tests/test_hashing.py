@@ -3,12 +3,16 @@ import pytest
 import tempfile
 import os
 from pathlib import Path
-from shared.hashing import sha256_file, build_media_manifest
+from shared.hashing import sha256_bytes, sha256_file, build_media_manifest
 
 # hashlib.sha256(b"hello world").hexdigest()
 HELLO_WORLD_SHA256 = "b94d27b9934d3e08a52e52d7da7dabfac484efe37a5380ee9088f7ace2efcde9"
 
 
+def test_sha256_bytes_known():
+    assert sha256_bytes(b"hello world") == HELLO_WORLD_SHA256
+
+
 def test_sha256_file_known():
     with tempfile.NamedTemporaryFile(delete=False, mode="wb") as f:
         f.write(b"hello world")
@@ -33,28 +37,78 @@ def test_sha256_file_consistency():
         os.unlink(path)
 
 
-def test_build_media_manifest_existing():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        (root / "video.webm").write_bytes(b"fake video")
-        (root / "image.png").write_bytes(b"fake image")
-        manifest = build_media_manifest(root, ["video.webm", "image.png"])
-        assert manifest["video.webm"] is not None
-        assert manifest["image.png"] is not None
-        assert len(manifest["video.webm"]) == 64
+def test_build_media_manifest_existing(tmp_path):
+    (tmp_path / "video.webm").write_bytes(b"fake video")
+    (tmp_path / "image.png").write_bytes(b"fake image")
+    manifest = build_media_manifest(tmp_path, ["video.webm", "image.png"])
+    assert manifest["video.webm"] is not None
+    assert manifest["image.png"] is not None
+    assert len(manifest["video.webm"]) == 64
+
+
+def test_build_media_manifest_missing(tmp_path):
+    manifest = build_media_manifest(tmp_path, ["missing.webm"])
+    assert manifest["missing.webm"] is None
+
+
+def test_build_media_manifest_mixed(tmp_path):
+    (tmp_path / "exists.webm").write_bytes(b"data")
+    manifest = build_media_manifest(tmp_path, ["exists.webm", "missing.png"])
+    assert manifest["exists.webm"] == sha256_bytes(b"data")
+    assert manifest["missing.png"] is None
+
+
+def test_build_media_manifest_str_root_and_subdirs(tmp_path):
+    (tmp_path / "videos").mkdir()
+    (tmp_path / "videos" / "a.webm").write_bytes(b"data")
+    manifest = build_media_manifest(str(tmp_path), ["videos/a.webm", "videos/../videos/a.webm"])
+    assert manifest["videos/a.webm"] == sha256_bytes(b"data")
+    assert manifest["videos/../videos/a.webm"] == sha256_bytes(b"data")
+
+
+def test_build_media_manifest_empty(tmp_path):
+    assert build_media_manifest(tmp_path, []) == {}
+
+
+def test_build_media_manifest_uses_cache(tmp_path):
+    (tmp_path / "video.webm").write_bytes(b"fake video")
+    cache = {}
+    first = build_media_manifest(tmp_path, ["video.webm"], cache)
+    key = str((tmp_path / "video.webm").resolve())
+    assert cache[key][2] == first["video.webm"]
+    # A matching (mtime, size) entry is trusted without re-hashing
+    mtime_ns, size, _ = cache[key]
+    cache[key] = (mtime_ns, size, "cached")
+    assert build_media_manifest(tmp_path, ["video.webm"], cache)["video.webm"] == "cached"
+
+
+def test_build_media_manifest_prune_drops_other_entries(tmp_path):
+    (tmp_path / "video.webm").write_bytes(b"fake video")
+    cache = {"/elsewhere/old.webm": (1, 2, "old")}
+    build_media_manifest(tmp_path, ["video.webm"], cache)
+    assert "/elsewhere/old.webm" in cache
+    build_media_manifest(tmp_path, ["video.webm"], cache, prune=True)
+    assert list(cache) == [str((tmp_path / "video.webm").resolve())]
+
+
+def test_build_media_manifest_cache_invalidated_on_change(tmp_path):
+    f = tmp_path / "video.webm"
+    f.write_bytes(b"fake video")
+    cache = {str(f.resolve()): (0, 0, "stale")}
+    manifest = build_media_manifest(tmp_path, ["video.webm"], cache)
+    assert manifest["video.webm"] == sha256_file(f)
+    assert cache[str(f.resolve())][2] == manifest["video.webm"]
 
 
-def test_build_media_manifest_missing():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        manifest = build_media_manifest(root, ["missing.webm"])
-        assert manifest["missing.webm"] is None
+def test_sha256_file_empty(tmp_path):
+    path = tmp_path / "empty.webm"
+    path.write_bytes(b"")
+    assert sha256_file(path) == "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
 
 
-def test_build_media_manifest_mixed():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        root = Path(tmpdir)
-        (root / "exists.webm").write_bytes(b"data")
-        manifest = build_media_manifest(root, ["exists.webm", "missing.png"])
-        assert manifest["exists.webm"] is not None
-        assert manifest["missing.png"] is None
+def test_sha256_file_rehashes_after_change(tmp_path):
+    path = tmp_path / "clip.webm"
+    path.write_bytes(b"hello world")
+    assert sha256_file(path) == HELLO_WORLD_SHA256
+    path.write_bytes(b"something else entirely")
+    assert sha256_file(path) != HELLO_WORLD_SHA256
@@ -0,0 +1,40 @@
+"""Tests for the background JSONL log writer."""
+import json
+import tempfile
+import time
+from pathlib import Path
+from shared.logging_utils import log_jsonl
+from shared import jsonl_writer
+
+
+def test_log_jsonl_writes_records():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        log_dir = Path(tmpdir) / "logs"
+        log_jsonl(log_dir, {"event": "a", "n": 1})
+        log_jsonl(log_dir, {"event": "b", "n": 2})
+        assert jsonl_writer.close()  # releases the files so the tempdir can go on Windows
+        log_file = log_dir / f"cuemesh-{time.strftime('%Y-%m-%d')}.jsonl"
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"event": "a", "n": 1},
+            {"event": "b", "n": 2},
+        ]
+
+
+def test_log_jsonl_batches_many_records():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        log_dir = Path(tmpdir)
+        for i in range(500):
+            log_jsonl(log_dir, {"n": i})
+        assert jsonl_writer.close()  # releases the files so the tempdir can go on Windows
+        log_file = log_dir / f"cuemesh-{time.strftime('%Y-%m-%d')}.jsonl"
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["n"] for line in lines] == list(range(500))
+
+
+def test_log_jsonl_non_str_keys_fall_back(tmp_path):
+    log_jsonl(tmp_path, {"event": "counts", "by_id": {1: "x"}, "path": Path("a")})
+    assert jsonl_writer.close()
+    log_file = tmp_path / f"cuemesh-{time.strftime('%Y-%m-%d')}.jsonl"
+    record = json.loads(log_file.read_text(encoding="utf-8"))
+    assert record == {"event": "counts", "by_id": {"1": "x"}, "path": "a"}
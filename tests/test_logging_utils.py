@@ -0,0 +1,32 @@
+"""Tests for logging setup."""
+import tempfile
+from pathlib import Path
+from shared.logging_utils import setup_rotating_logger, shutdown_logging
+
+
+def test_setup_rotating_logger_writes_file():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        log_dir = Path(tmpdir) / "logs"
+        logger = setup_rotating_logger("cuemesh.test.rotating", log_dir)
+        try:
+            assert setup_rotating_logger("cuemesh.test.rotating", log_dir) is logger
+            assert len(logger.handlers) == 1
+            logger.debug("hello %s", "file")
+        finally:
+            shutdown_logging()
+        assert logger.handlers == []
+        text = (log_dir / "cuemesh.test.rotating.log").read_text(encoding="utf-8")
+        assert "[DEBUG] cuemesh.test.rotating: hello file" in text
+
+
+def test_setup_rotating_logger_after_shutdown(tmp_path):
+    logger = setup_rotating_logger("cuemesh.test.restart", tmp_path)
+    logger.info("first")
+    shutdown_logging()
+    assert setup_rotating_logger("cuemesh.test.restart", tmp_path) is logger
+    try:
+        logger.warning("second")
+    finally:
+        shutdown_logging()
+    text = (tmp_path / "cuemesh.test.restart.log").read_text(encoding="utf-8")
+    assert "first" in text and "second" in text
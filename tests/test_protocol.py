@@ -35,3 +35,44 @@ def test_round_trip():
     assert msg_type == "PLAY_AT"
     assert parsed["cue_id"] == "q1"
     assert parsed["master_start_utc_ms"] == 9999999999
+
+
+def test_parse_envelope_bytes():
+    raw = make_envelope("SEEK_TO", {"position_ms": 1500}).encode("utf-8")
+    msg_type, ts, payload = parse_envelope(raw)
+    assert msg_type == "SEEK_TO"
+    assert ts > 0
+    assert payload == {"position_ms": 1500}
+
+
+def test_parse_envelope_interns_type():
+    from shared.protocol import MSG_PLAY_AT
+    msg_type, _, _ = parse_envelope(make_envelope("PLAY_AT", {}))
+    assert msg_type is MSG_PLAY_AT
+
+
+def test_make_envelope_empty_payload():
+    msg_type, ts, payload = parse_envelope(make_envelope("PAUSE", {}))
+    assert msg_type == "PAUSE"
+    assert ts > 0
+    assert payload == {}
+    data = json.loads(make_envelope("STOP", {}))
+    assert data["type"] == "STOP"
+    assert data["payload"] == {}
+
+
+def test_binary_envelope_round_trip():
+    pytest.importorskip("msgpack")
+    from shared.protocol import make_envelope_binary, parse_envelope_binary, MSG_PLAY_AT
+    payload = {"cue_id": "q1", "master_start_utc_ms": 9999999999}
+    raw = make_envelope_binary("PLAY_AT", payload)
+    assert isinstance(raw, bytes)
+    msg_type, ts, parsed = parse_envelope_binary(raw)
+    assert msg_type is MSG_PLAY_AT
+    assert ts > 0
+    assert parsed == payload
+
+
+def test_make_envelope_non_str_keys_and_big_ints():
+    _, _, payload = parse_envelope(make_envelope("X", {1: "a", "big": 2 ** 70}))
+    assert payload == {"1": "a", "big": 2 ** 70}
@@ -0,0 +1,39 @@
+"""Tests for the controller server's playhead tracking."""
+import time
+import pytest
+
+pytest.importorskip("websockets")
+from controller.server import ControllerServer
+
+
+async def test_playhead_play_pause_stop():
+    server = ControllerServer()
+    assert server.playhead_ms == 0
+
+    master_start = await server.send_play_at("q1", start_lead_ms=50, start_time_ms=2000)
+    # Held at the cue start until master_start, then advances
+    assert server.playhead_ms == 2000
+    time.sleep((master_start - time.time() * 1000) / 1000 + 0.1)
+    assert 2050 <= server.playhead_ms < 3000
+
+    await server.send_pause()
+    paused = server.playhead_ms
+    time.sleep(0.05)
+    assert server.playhead_ms == paused
+
+    await server.send_seek(500)
+    assert server.playhead_ms == 500
+
+    await server.send_stop()
+    assert server.playhead_ms == 0
+
+
+async def test_playhead_freezes_without_clients():
+    server = ControllerServer()
+    await server.send_play_at("q1", start_lead_ms=0)
+    time.sleep(0.05)
+    server._resync_playhead()
+    frozen = server.playhead_ms
+    assert frozen >= 50
+    time.sleep(0.05)
+    assert server.playhead_ms == frozen
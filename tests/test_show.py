@@ -179,3 +179,120 @@ def test_load_example_show():
     assert len(show.cues) > 0
     errors = show.validate()
     assert errors == [], f"Example show has validation errors: {errors}"
+
+
+def test_save_and_reload_escapes_strings():
+    show = Show(
+        title='Say "hello"',
+        cues=[Cue(id="q1", name="Back\\slash", type="video", file="v.webm",
+                  notes='Line one\nLine "two"\ttabbed')],
+    )
+    with tempfile.NamedTemporaryFile(suffix=".cuemesh.toml", delete=False) as f:
+        path = Path(f.name)
+    try:
+        save_show(show, path)
+        loaded = load_show(path)
+        assert loaded.title == 'Say "hello"'
+        assert loaded.cues[0].name == "Back\\slash"
+        assert loaded.cues[0].notes == 'Line one\nLine "two"\ttabbed'
+    finally:
+        os.unlink(path)
+
+
+def test_cue_validation_invalid_id_chars():
+    for bad in ("cue 1", "cue/1", "cue-1\n"):
+        errors = Cue(id=bad, type="video", file="a.webm").validate()
+        assert any("invalid characters" in e for e in errors)
+
+
+def test_show_validation_duplicate_reported_once():
+    show = Show(cues=[Cue(id="dup", type="video", file=f"{i}.webm") for i in range(3)])
+    dups = [e for e in show.validate() if "duplicate" in e.lower()]
+    assert dups == ["Duplicate cue id: dup (×3)"]
+
+
+def test_validate_media_paths():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        (base / "media" / "videos").mkdir(parents=True)
+        (base / "media" / "videos" / "a.webm").write_bytes(b"x")
+        show = Show(media_root="media", cues=[
+            Cue(id="q1", file="videos/a.webm"),
+            Cue(id="q2", file="videos/../missing.webm"),
+        ])
+        results = show.validate_media_paths(base)
+        root = (base / "media").resolve()
+        assert results[0] == ("q1", str(root / "videos" / "a.webm"), True)
+        assert results[1] == ("q2", str(root / "missing.webm"), False)
+
+
+def test_show_cue_mutators_keep_mirrors():
+    show = Show(cues=[Cue(id="a", file="a.webm"), Cue(id="b", file="b.webm")])
+    show.add_cue(Cue(id="c", file="c.webm"))
+    show.insert_cue(1, Cue(id="x", file="x.webm"))
+    assert show.cue_ids == ["a", "x", "b", "c"]
+    show.swap_cues(0, 3)
+    assert show.cue_ids == ["c", "x", "b", "a"]
+    assert show.index_of("a") == 3
+    assert show.remove_cue(1).id == "x"
+    assert show.cue_ids == ["c", "b", "a"]
+    assert show.index_of("x") is None
+    show.cues[0].id = "renamed"
+    show.reindex()
+    assert show.index_of("renamed") == 0
+
+
+def test_show_direct_cue_edits_not_masked():
+    show = Show(cues=[Cue(id="a", file="a.webm"), Cue(id="b", file="b.webm")])
+    show.cues[1].id = "a"
+    assert show.validate() == ["Duplicate cue id: a (×2)"]
+    assert show.index_of("b") is None
+    show.cues.pop()
+    show.cues.append(Cue(id="c", file="c.webm"))
+    assert show.index_of("c") == 1
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results = show.validate_media_paths(Path(tmpdir))
+        assert [(cid, Path(p).name) for cid, p, _ in results] == [("a", "a.webm"), ("c", "c.webm")]
+
+
+def test_load_show_cue_defaults_and_unknown_keys():
+    toml = '[show]\ntitle = "T"\n\n[[cues]]\nid = "q1"\nfile = "a.webm"\nfuture_field = 1\n'
+    with tempfile.NamedTemporaryFile(suffix=".cuemesh.toml", mode="wb", delete=False) as f:
+        f.write(toml.encode())
+        path = Path(f.name)
+    try:
+        cue = load_show(path).cues[0]
+        assert cue == Cue(id="q1", file="a.webm")
+    finally:
+        os.unlink(path)
+
+
+def test_load_show_cached_returns_independent_copies():
+    toml = '[show]\ntitle = "T"\n\n[[cues]]\nid = "q1"\nfile = "a.webm"\n'
+    with tempfile.NamedTemporaryFile(suffix=".cuemesh.toml", mode="wb", delete=False) as f:
+        f.write(toml.encode())
+        path = Path(f.name)
+    try:
+        first = load_show(path)
+        first.cues[0].name = "mutated"
+        first.add_cue(Cue(id="q2", file="b.webm"))
+        second = load_show(path)
+        assert second.cue_ids == ["q1"]
+        assert second.cues[0].name == ""
+        # Editing the file invalidates the cache
+        path.write_bytes(toml.replace('"T"', '"Edited"').encode())
+        assert load_show(path).title == "Edited"
+    finally:
+        os.unlink(path)
+
+
+def test_load_show_after_same_size_save(tmp_path):
+    path = tmp_path / "show.cuemesh.toml"
+    save_show(Show(title="Before", cues=[Cue(id="q1", file="a.webm")]), path)
+    st = os.stat(path)
+    assert load_show(path).title == "Before"
+    save_show(Show(title="Afterr", cues=[Cue(id="q1", file="a.webm")]), path)
+    # Simulate a coarse-mtime filesystem: same size, same mtime
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert os.stat(path).st_size == st.st_size
+    assert load_show(path).title == "Afterr"